@@ -106,7 +106,7 @@ if [[ -f "requirements.txt" ]]; then
     pip3 install -r requirements.txt
 else
     echo -e "${YELLOW}requirements.txt not found, installing basic dependencies...${NC}"
-    pip3 install PyGithub requests python-dotenv
+    pip3 install 'httpx[http2]' orjson python-dotenv
 fi
 
 # Check if git is configured